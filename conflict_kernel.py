@@ -0,0 +1,57 @@
+"""
+Batch conflict detection over the flat slot arrays.
+
+The kernel walks the structure-of-arrays slot data (start, end, day
+bitmask, owning-course index) and reports every pair of courses whose
+slots overlap. When numba is installed the loop is JIT-compiled to
+native code; otherwise the same function runs as pure Python, so numba
+stays an optional dependency.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """
+        No-op stand-in for numba.njit when numba is not installed.
+        """
+        def wrap(func):
+            return func
+        return wrap
+
+
+# The day alphabet is a fixed 7-letter set, so all day-membership logic
+# partially evaluates to one mask AND; the specialized checker is built
+# as source at import time and exec-compiled into this module
+_SLOTS_OVERLAP_SRC = """
+def slots_overlap(a_mask, a_start, a_end, b_mask, b_start, b_end):
+    return bool(a_mask & b_mask) and a_start < b_end and b_start < a_end
+"""
+exec(compile(_SLOTS_OVERLAP_SRC, "<conflict codegen>", "exec"))
+slots_overlap = njit()(slots_overlap)
+
+
+@njit(cache=True)
+def pairwise_conflicts(starts, ends, days, course_idx):
+    """
+    Find all conflicting course pairs in one pass over the slot arrays.
+
+    Args:
+        starts (list[int]): Slot start times in minutes since midnight.
+        ends (list[int]): Slot end times in minutes since midnight.
+        days (list[int]): 7-bit day masks per slot.
+        course_idx (list[int]): Index of the owning course per slot.
+
+    Returns:
+        list[tuple[int, int]]: (i, j) course-index pairs with i < j whose
+        slots overlap on at least one shared day.
+    """
+    pairs = []
+    n = len(starts)
+    for i in range(n):
+        for j in range(i + 1, n):
+            if course_idx[i] != course_idx[j] and slots_overlap(
+                    days[i], starts[i], ends[i],
+                    days[j], starts[j], ends[j]):
+                pairs.append((course_idx[i], course_idx[j]))
+    return pairs
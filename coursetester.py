@@ -1,9 +1,60 @@
+import atexit
+import bisect
+import functools
+import mmap
+import os
+import re
 import tkinter as tk
 from tkinter import ttk
 import sv_ttk
 from tkinter import messagebox
 import pyperclip as pc
 
+from conflict_kernel import pairwise_conflicts
+
+# Each day maps to one bit in a 7-bit mask; "TH" is Thursday and must be
+# matched before a lone "T" (Tuesday) when parsing day strings like "TTH"
+DAY_BIT = {"M": 0, "T": 1, "W": 2, "TH": 3, "F": 4, "S": 5, "SU": 6}
+# Number of 15-minute slots in a day; each day gets its own 96-bit window
+# inside a single combined bitmap integer
+QUARTERS_PER_DAY = 96
+
+# One course block in courses.txt: category line, course number line, then
+# the indented time-slot lines up to the next blank line. Bytes patterns
+# so they run directly over the memory-mapped file, which means no
+# universal-newline translation: CRLF line endings must be matched
+# explicitly so the captures stay free of carriage returns
+COURSE_BLOCK_RE = re.compile(
+    rb"Category: *(.+?)\r?\nCourse Number: *(.+?)\r?\n((?:[ \t]+.+\n?)*)")
+# One time-slot line, e.g. "  MWF 8:00am-9:00am"
+TIME_SLOT_RE = re.compile(
+    rb"[ \t]+(\S+) (\d{1,2}):(\d{2})([ap])m-(\d{1,2}):(\d{2})([ap])m",
+    re.IGNORECASE)
+
+
+
+def parse_day_bits(days):
+    """
+    Convert a day string (e.g., "MWF", "TTH") to a 7-bit day mask.
+
+    Args:
+        days (str): Days of the week, using "TH" for Thursday.
+
+    Returns:
+        int: Bitmask with one bit set per day.
+    """
+    bits = 0
+    i = 0
+    while i < len(days):
+        token = days[i:i+2]
+        if token in DAY_BIT:
+            bits |= 1 << DAY_BIT[token]
+            i += 2
+        else:
+            bits |= 1 << DAY_BIT[days[i]]
+            i += 1
+    return bits
+
 
 class TimeSlot:
     """
@@ -11,8 +62,11 @@ class TimeSlot:
 
     Attributes:
         days (str): Days of the week when the course is held.
-        start_time (float): Start time of the course in 24-hour format.
-        end_time (float): End time of the course in 24-hour format.
+        start_time (int): Start time of the course in minutes since midnight.
+        end_time (int): End time of the course in minutes since midnight.
+        day_bits (int): 7-bit mask with one bit set per day in `days`.
+        bitmap (int): Combined bitmap with one bit per occupied 15-minute
+            slot on each day, used for O(1) conflict checks.
     """
 
     def __init__(self, days, start_time, end_time):
@@ -21,12 +75,23 @@ class TimeSlot:
 
         Args:
             days (str): Days of the week when the course is held.
-            start_time (float): Start time of the course in 24-hour format.
-            end_time (float): End time of the course in 24-hour format.
+            start_time (int): Start time of the course in minutes since midnight.
+            end_time (int): End time of the course in minutes since midnight.
         """
         self.days = days
         self.start_time = start_time
         self.end_time = end_time
+        # Precompute the day mask and the per-day time bitmap once, so the
+        # conflict check is a single integer AND instead of nested loops
+        self.day_bits = parse_day_bits(days)
+        start_quarter = start_time // 15
+        end_quarter = -(-end_time // 15)  # partial quarters count as busy
+        time_bits = ((1 << end_quarter) - 1) ^ ((1 << start_quarter) - 1)
+        self.bitmap = sum(
+            time_bits << (i * QUARTERS_PER_DAY)
+            for i in range(7)
+            if (self.day_bits >> i) & 1
+        )
 
     def has_time_conflict(self, other):
         """
@@ -38,11 +103,7 @@ class TimeSlot:
         Returns:
             bool: True if there is a conflict, False otherwise.
         """
-        for day in self.days:
-            if day in other.days:
-                if not (self.end_time <= other.start_time or self.start_time >= other.end_time):
-                    return True
-        return False
+        return bool(self.bitmap & other.bitmap)
 
 
 class Course:
@@ -52,6 +113,8 @@ class Course:
     Attributes:
         course_number (str): The course number.
         time_slots (list[TimeSlot]): List of time slots for the course.
+        course_mask (int): OR of all time-slot bitmaps, so course-level
+            conflicts are a single integer AND.
     """
 
     def __init__(self, course_number):
@@ -63,6 +126,7 @@ class Course:
         """
         self.course_number = course_number
         self.time_slots = []
+        self.course_mask = 0
 
     def add_time_slot(self, days, start_time, end_time):
         """
@@ -70,10 +134,12 @@ class Course:
 
         Args:
             days (str): Days of the week when the course is held.
-            start_time (float): Start time of the course in 24-hour format.
-            end_time (float): End time of the course in 24-hour format.
+            start_time (int): Start time of the course in minutes since midnight.
+            end_time (int): End time of the course in minutes since midnight.
         """
-        self.time_slots.append(TimeSlot(days, start_time, end_time))
+        slot = TimeSlot(days, start_time, end_time)
+        self.time_slots.append(slot)
+        self.course_mask |= slot.bitmap
 
     def has_time_conflict(self, other):
         """
@@ -85,11 +151,7 @@ class Course:
         Returns:
             bool: True if there is a conflict, False otherwise.
         """
-        for my_slot in self.time_slots:
-            for other_slot in other.time_slots:
-                if my_slot.has_time_conflict(other_slot):
-                    return True
-        return False
+        return bool(self.course_mask & other.course_mask)
 
 
 class CourseRegistration:
@@ -112,7 +174,17 @@ class CourseRegistration:
         self.root = root
         self.courses = {}
         self.schedule = []
-        self.load_courses_from_file()
+        self._conflict_cache = {}
+        self._course_to_category = {}
+        self._course_index = {}
+        self._clique_bits = []
+        self.day_intervals = {day: [] for day in range(7)}
+        self._courses_mtime = 0
+        self._reload_courses_if_changed()
+        # Keep one buffered append handle open instead of reopening the
+        # file on every add; flushed before each schedule generation
+        self._course_file = open("courses.txt", "a", buffering=1 << 16)
+        atexit.register(self._course_file.close)
         self.create_ui()
 
     def generate_schedule(self):
@@ -120,42 +192,263 @@ class CourseRegistration:
         Generate a schedule by processing courses in each category.
         """
         self.schedule = []
-        self.load_courses_from_file()
-        categories = list(self.courses.keys())  # Use a list to maintain order
+        self.day_intervals = {day: [] for day in range(7)}
+        self._course_file.flush()
+        self._reload_courses_if_changed()
+        # Process smaller categories first so the search tree is pruned early
+        categories = sorted(
+            self.courses.keys(), key=lambda c: len(self.courses[c]))
         self.process_courses(categories)
 
+    def _reload_courses_if_changed(self):
+        """
+        Re-read courses.txt only if it changed since the last load.
+
+        Skips the disk read, the parse, and the conflict-cache rebuild
+        entirely when the file's mtime is unchanged.
+        """
+        try:
+            mtime = os.path.getmtime("courses.txt")
+        except OSError:
+            return
+        if mtime != self._courses_mtime:
+            self.load_courses_from_file()
+            self._build_conflict_cache()
+            self._courses_mtime = mtime
+
+    def _insert_course_intervals(self, course):
+        """
+        Insert an accepted course's intervals into the per-day sorted lists.
+
+        Args:
+            course (Course): The course that was added to the schedule.
+        """
+        for slot in course.time_slots:
+            for day in range(7):
+                if (slot.day_bits >> day) & 1:
+                    bisect.insort(
+                        self.day_intervals[day],
+                        (slot.start_time, slot.end_time, course),
+                    )
+
+    def _build_slot_arrays(self):
+        """
+        Flatten all time slots into parallel arrays (structure-of-arrays).
+
+        Instead of chasing Course -> TimeSlot -> attribute pointers per
+        pair, bulk conflict detection walks four flat arrays: slot start,
+        slot end, day bitmask, and the index of the owning course.
+        """
+        self.all_courses = [
+            course for courses in self.courses.values() for course in courses
+        ]
+        self.slot_starts = []
+        self.slot_ends = []
+        self.slot_days = []
+        self.slot_course = []
+        for index, course in enumerate(self.all_courses):
+            for slot in course.time_slots:
+                self.slot_starts.append(slot.start_time)
+                self.slot_ends.append(slot.end_time)
+                self.slot_days.append(slot.day_bits)
+                self.slot_course.append(index)
+
+    def _build_conflict_cache(self):
+        """
+        Precompute pairwise conflicts between all loaded courses.
+
+        Conflicting pairs are found by the conflict_kernel pass over the
+        flat slot arrays and stored in a dict keyed by the frozenset of
+        the two course ids, so repeated schedule generations do O(1)
+        lookups instead of re-walking every time-slot pair.
+        Non-conflicting pairs are memoized lazily on first lookup.
+        """
+        self._build_slot_arrays()
+        self._conflict_cache = {}
+        for i, j in pairwise_conflicts(self.slot_starts, self.slot_ends,
+                                       self.slot_days, self.slot_course):
+            key = frozenset((id(self.all_courses[i]),
+                             id(self.all_courses[j])))
+            self._conflict_cache[key] = True
+        self._build_conflict_cliques()
+
+    def _build_conflict_cliques(self):
+        """
+        Sweep each day's slot endpoints to find conflict cliques.
+
+        Walking the sorted start/end events keeps the set of currently
+        active courses; the active set at each start event is a clique of
+        mutually conflicting courses. Each course gets a bitmask of the
+        cliques it belongs to, so two loaded courses conflict iff their
+        clique masks share a bit.
+        """
+        events_per_day = [[] for _ in range(7)]
+        for i in range(len(self.slot_starts)):
+            for day in range(7):
+                if (self.slot_days[i] >> day) & 1:
+                    course = self.slot_course[i]
+                    # Ends sort before starts at the same time, so
+                    # back-to-back slots never land in one clique
+                    events_per_day[day].append(
+                        (self.slot_starts[i], 1, course))
+                    events_per_day[day].append(
+                        (self.slot_ends[i], 0, course))
+        self._clique_bits = [0] * len(self.all_courses)
+        self._course_index = {
+            id(course): i for i, course in enumerate(self.all_courses)
+        }
+        clique = 0
+        for events in events_per_day:
+            events.sort()
+            # Count active slots per course: a course with overlapping
+            # slots on one day must stay active until its last slot ends
+            active = {}
+            for _, is_start, course in events:
+                if not is_start:
+                    if active[course] > 1:
+                        active[course] -= 1
+                    else:
+                        del active[course]
+                    continue
+                active[course] = active.get(course, 0) + 1
+                if len(active) > 1:
+                    for member in active:
+                        self._clique_bits[member] |= 1 << clique
+                    clique += 1
+
+    def _courses_conflict(self, course_a, course_b):
+        """
+        Check whether two courses conflict, using the precomputed cache.
+
+        Args:
+            course_a (Course): The first course.
+            course_b (Course): The second course.
+
+        Returns:
+            bool: True if there is a conflict, False otherwise.
+        """
+        index_a = self._course_index.get(id(course_a))
+        index_b = self._course_index.get(id(course_b))
+        if index_a is not None and index_b is not None:
+            return bool(
+                self._clique_bits[index_a] & self._clique_bits[index_b])
+        # Courses added since the last load fall back to the memo dict
+        key = frozenset((id(course_a), id(course_b)))
+        result = self._conflict_cache.get(key)
+        if result is None:
+            result = course_a.has_time_conflict(course_b)
+            self._conflict_cache[key] = result
+        return result
+
+    def plan_schedule(self, categories):
+        """
+        Pick one non-conflicting course per category without touching the UI.
+
+        Args:
+            categories (list[str]): List of categories to process.
+
+        Returns:
+            list[tuple[str, Course]]: (category, course) candidates that
+            conflict neither with the current schedule nor each other.
+        """
+        candidates = []
+        for category in categories:
+            for course in self.courses.get(category, ()):
+                if self.has_conflict_with_schedule(course):
+                    continue
+                if any(self._courses_conflict(course, chosen)
+                       for _, chosen in candidates):
+                    continue
+                candidates.append((category, course))
+                break
+        return candidates
+
     def process_courses(self, categories):
         """
         Process courses in each category to generate a schedule.
 
+        Plans all candidates first, then shows one consolidated dialog
+        instead of a blocking message box per course.
+
         Args:
             categories (list[str]): List of categories to process.
         """
-        for category in categories:
-            if category in self.courses:
-                for course in self.courses[category]:
-                    if not self.has_conflict_with_schedule(course):
-                        time_slots_str = "\n".join(
-                            f" {time_slot.days} {format_time(
-                                time_slot.start_time)}-{format_time(time_slot.end_time)}"
-                            for time_slot in course.time_slots
-                        )
-                        # Copy course number to clipboard
-                        pc.copy(course.course_number)
-                        response = messagebox.askyesnocancel(
-                            f"Accept {category} Course",
-                            f"Accept course {course.course_number} in {
-                                category}?\n{time_slots_str}",
-                            default=messagebox.YES
-                        )
-                        if response is None:
-                            return
-                        elif response:
-                            self.schedule.append(course)
-                            break
-                        else:
-                            continue
-        self.display_schedule()
+        candidates = self.plan_schedule(categories)
+        if not candidates:
+            self.display_schedule()
+            return
+        self._show_candidate_dialog(candidates)
+
+    def _show_candidate_dialog(self, candidates):
+        """
+        Show all planned candidates in a single accept/skip dialog.
+
+        Args:
+            candidates (list[tuple[str, Course]]): Planned (category,
+                course) pairs; all start marked as accepted.
+        """
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Proposed Schedule")
+        dialog.columnconfigure(0, weight=1)
+        dialog.rowconfigure(1, weight=1)
+
+        hint = ttk.Label(
+            dialog, text="Double-click a row to accept or skip it.")
+        hint.grid(row=0, column=0, columnspan=2, padx=10, pady=(10, 0))
+
+        tree = ttk.Treeview(
+            dialog,
+            columns=("accept", "category", "course", "times"),
+            show="headings",
+            height=min(len(candidates), 12),
+        )
+        tree.heading("accept", text="Accept")
+        tree.heading("category", text="Category")
+        tree.heading("course", text="Course Number")
+        tree.heading("times", text="Days and Times")
+        tree.column("accept", width=60, anchor=tk.CENTER)
+        tree.column("category", width=100)
+        tree.column("course", width=110)
+        tree.column("times", width=320)
+        for i, (category, course) in enumerate(candidates):
+            times = "; ".join(
+                f"{ts.days} {format_time(ts.start_time)}-"
+                f"{format_time(ts.end_time)}"
+                for ts in course.time_slots
+            )
+            tree.insert("", tk.END, iid=str(i),
+                        values=("Yes", category, course.course_number, times))
+        tree.grid(row=1, column=0, columnspan=2,
+                  padx=10, pady=10, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        def toggle_row(event):
+            item = tree.identify_row(event.y)
+            if item:
+                accepted = tree.set(item, "accept") == "Yes"
+                tree.set(item, "accept", "No" if accepted else "Yes")
+
+        tree.bind("<Double-1>", toggle_row)
+
+        def accept_selected():
+            accepted_numbers = []
+            for i, (category, course) in enumerate(candidates):
+                if tree.set(str(i), "accept") == "Yes":
+                    self.schedule.append(course)
+                    self._insert_course_intervals(course)
+                    accepted_numbers.append(course.course_number)
+            if accepted_numbers:
+                # Copy accepted course numbers to clipboard
+                pc.copy("\n".join(accepted_numbers))
+            dialog.destroy()
+            self.display_schedule()
+
+        accept_button = ttk.Button(
+            dialog, text="Add Selected", command=accept_selected)
+        accept_button.grid(row=2, column=0, padx=10, pady=(0, 10), sticky=tk.E)
+        cancel_button = ttk.Button(
+            dialog, text="Cancel", command=dialog.destroy)
+        cancel_button.grid(row=2, column=1, padx=10, pady=(0, 10), sticky=tk.W)
+        dialog.grab_set()
 
     def has_conflict_with_schedule(self, course):
         """
@@ -167,22 +460,37 @@ class CourseRegistration:
         Returns:
             bool: True if there is a conflict, False otherwise.
         """
-        for scheduled_course in self.schedule:
-            if course.has_time_conflict(scheduled_course):
-                return True
+        # Scheduled intervals on a day never overlap each other, so only
+        # the neighbors around the candidate's start can conflict with it
+        for slot in course.time_slots:
+            for day in range(7):
+                if not (slot.day_bits >> day) & 1:
+                    continue
+                intervals = self.day_intervals[day]
+                idx = bisect.bisect_right(intervals, (slot.start_time,))
+                if idx > 0 and intervals[idx-1][1] > slot.start_time:
+                    return True
+                if idx < len(intervals) and intervals[idx][0] < slot.end_time:
+                    return True
         return False
 
     def display_schedule(self):
         """
         Display the current schedule in the text box.
         """
-        self.schedule_text.delete(1.0, tk.END)
-        self.schedule_text.insert(tk.END, f"Courses Registered:\n")
+        # Build the whole text once; each insert call crosses into Tcl
+        # and reflows the widget, so do it a single time
+        buf = ["Courses Registered:\n"]
         for course in self.schedule:
-            for category, courses in self.courses.items():
-                if course in courses:
-                    self.schedule_text.insert(tk.END, f"{category} course {
-                                              course.course_number}\n")
+            category = self._course_to_category[id(course)]
+            buf.append(f"{category} course {course.course_number}\n")
+            buf.extend(
+                f"  {ts.days} {format_time(ts.start_time)}-"
+                f"{format_time(ts.end_time)}\n"
+                for ts in course.time_slots
+            )
+        self.schedule_text.delete(1.0, tk.END)
+        self.schedule_text.insert(tk.END, "".join(buf))
 
     def clear_entries(self):
         """
@@ -254,27 +562,28 @@ class CourseRegistration:
         for i in range(0, len(days_times_list), 2):
             days = days_times_list[i]
             times = days_times_list[i+1]
-            start_time, end_time = times.split("-")
-            start_time = convert_time_to_float(start_time)
-            end_time = convert_time_to_float(end_time)
+            start_time, _, end_time = times.partition("-")
+            start_time = convert_time_to_minutes(start_time)
+            end_time = convert_time_to_minutes(end_time)
             time_slots.append((days, start_time, end_time))
 
         # Add course to the system
-        if category not in self.courses:
-            self.courses[category] = []
         course = Course(course_number)
         for days, start_time, end_time in time_slots:
             course.add_time_slot(days, start_time, end_time)
-        self.courses[category].append(course)
-
-        # Write course data to file
-        with open("courses.txt", "a") as file:
-            file.write(f"Category: {category}\n")
-            file.write(f"Course Number: {course_number}\n")
-            for time_slot in course.time_slots:
-                file.write(f" {time_slot.days} {format_time(
-                    time_slot.start_time)}-{format_time(time_slot.end_time)}\n")
-            file.write("\n")
+        self.courses.setdefault(category, []).append(course)
+        self._course_to_category[id(course)] = category
+        # Invalidate cached conflicts; they are refilled lazily on lookup
+        self._conflict_cache = {}
+
+        # Write course data to the buffered file handle
+        self._course_file.write(f"Category: {category}\n")
+        self._course_file.write(f"Course Number: {course_number}\n")
+        for time_slot in course.time_slots:
+            start = format_time(time_slot.start_time)
+            end = format_time(time_slot.end_time)
+            self._course_file.write(f" {time_slot.days} {start}-{end}\n")
+        self._course_file.write("\n")
 
         # Clear entries
         self.clear_entries()
@@ -283,31 +592,45 @@ class CourseRegistration:
         """
         Load courses from the file.
         """
+        # Rebuild from scratch; appending into the existing lists used to
+        # duplicate every course on each reload
+        self.courses = {}
+        self._course_to_category = {}
         try:
-            with open("courses.txt", "r") as file:
-                lines = file.readlines()
-                category = None
-                course_number = None
-                course = None
-                for line in lines:
-                    line = line.strip()
-                    if line.startswith("Category:"):
-                        category = line.split(": ")[1]
-                        if category not in self.courses:
-                            self.courses[category] = []
-                    elif line.startswith("Course Number:"):
-                        course_number = line.split(": ")[1]
-                        course = Course(course_number)
-                    elif line.startswith(" "):
-                        days, times = line[2:].split(" ", 1)
-                        start_time, end_time = times.split("-")
-                        start_time = convert_time_to_float(start_time)
-                        end_time = convert_time_to_float(end_time)
-                        course.add_time_slot(days, start_time, end_time)
-                    elif line == "":
-                        self.courses[category].append(course)
+            file = open("courses.txt", "rb")
         except FileNotFoundError:
-            pass
+            return
+        with file:
+            try:
+                # Map the file instead of reading it: pages stream in on
+                # demand, so peak memory stays O(1) in the file size
+                content = mmap.mmap(file.fileno(), 0,
+                                    access=mmap.ACCESS_READ)
+            except ValueError:
+                # mmap rejects empty files; nothing to load anyway
+                return
+            with content:
+                for match in COURSE_BLOCK_RE.finditer(content):
+                    category, course_number, slot_lines = match.groups()
+                    category = category.decode()
+                    course = Course(course_number.decode())
+                    for slot in TIME_SLOT_RE.finditer(slot_lines):
+                        days, sh, sm, sap, eh, em, eap = slot.groups()
+                        start_time = (
+                            int(sh) % 12 + 12 * (sap in b"pP")) * 60 + int(sm)
+                        end_time = (
+                            int(eh) % 12 + 12 * (eap in b"pP")) * 60 + int(em)
+                        course.add_time_slot(
+                            days.decode(), start_time, end_time)
+                    self.courses.setdefault(category, []).append(course)
+                    self._course_to_category[id(course)] = category
+        # Earliest-finish-time greedy: courses that end earlier leave more
+        # room for the rest, so trying them first short-circuits sooner
+        for courses in self.courses.values():
+            courses.sort(key=lambda course: (
+                max((ts.end_time for ts in course.time_slots), default=0),
+                len(course.time_slots),
+            ))
 
 
 def __init__(self, root):
@@ -329,48 +652,42 @@ def __init__(self, root):
         self.category_entry.focus_set()
 
 
-def convert_time_to_float(time_str):
+def convert_time_to_minutes(time_str):
     """
-    Convert a time string to a float.
+    Convert a time string to minutes since midnight.
 
     Args:
         time_str (str): Time string in AM/PM format.
 
     Returns:
-        float: Time in 24-hour format as a float.
+        int: Time as minutes since midnight (0..1439).
     """
-    time_str = time_str.lower()
-    if "am" in time_str:
-        time_str = time_str.replace("am", "")
-        hour, minute = map(int, time_str.split(":"))
-        if hour == 12:
-            hour = 0
-    elif "pm" in time_str:
-        time_str = time_str.replace("pm", "")
-        hour, minute = map(int, time_str.split(":"))
-        if hour != 12:
-            hour += 12
-    else:
+    if time_str[-1] not in "mM" or time_str[-2] not in "aApP":
         raise ValueError("Invalid time format. Use AM/PM.")
-    return hour + minute / 60
-
-def format_time(time_float):
+    colon = time_str.index(":")
+    hour = int(time_str[:colon]) % 12
+    minute = int(time_str[colon+1:colon+3])
+    if time_str[-2] in "pP":
+        hour += 12
+    return hour * 60 + minute
+
+@functools.lru_cache(maxsize=1440)
+def format_time(minutes):
     """
-    Format a time float to a string.
+    Format a time in minutes since midnight to a string.
+
+    Class times recur constantly, so results are memoized; with minute
+    inputs there are at most 1440 distinct values.
 
     Args:
-        time_float (float): Time in 24-hour format as a float.
+        minutes (int): Time as minutes since midnight.
 
     Returns:
         str: Time string in AM/PM format.
     """
-    hour = int(time_float)
-    minute = int((time_float % 1) * 60)
+    hour, minute = divmod(minutes, 60)
     am_pm = "AM" if hour < 12 else "PM"
-    if hour == 0:
-        hour = 12
-    elif hour > 12:
-        hour -= 12
+    hour = hour % 12 or 12
     return f"{hour}:{minute:02d}{am_pm}"
 
 def main():